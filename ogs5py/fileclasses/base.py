@@ -187,8 +187,12 @@ class File(object):
         # update the content
         self._update_out()
         # create the file path
-        if not os.path.exists(self.task_root):
+        # race-free directory creation (no exist_ok in python 2)
+        try:
             os.makedirs(self.task_root)
+        except OSError:
+            if not os.path.isdir(self.task_root):
+                raise
         f_path = self.file_path
         # check if we can copy the file or if we need to write it from data
         if self.copy_file is None:
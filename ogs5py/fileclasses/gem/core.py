@@ -360,8 +360,12 @@ class GEMinit(object):
         Its path is given by "task_root+task_id+file_ext".
         """
         # create the file path
-        if not os.path.exists(self.task_root):
+        # race-free directory creation (no exist_ok in python 2)
+        try:
             os.makedirs(self.task_root)
+        except OSError:
+            if not os.path.isdir(self.task_root):
+                raise
         f_path = os.path.join(self.task_root, self.lst_name)
         # save the data
         if not self.is_empty:
@@ -7,14 +7,18 @@ import os
 import numpy as np
 
 # import ogs5py.fileclasses.gli.generator as gen
-from ogs5py.tools.types import STRTYPE, EMPTY_GLI
+from ogs5py.tools.types import STRTYPE
 from ogs5py.fileclasses.gli.checker import (
     check_gli_dict,
     check_polyline,
     check_surface,
     check_volume,
 )
-from ogs5py.fileclasses.gli.tools import load_ogs5gli, save_ogs5gli
+from ogs5py.fileclasses.gli.tools import (
+    load_ogs5gli,
+    new_gli_dict,
+    save_ogs5gli,
+)
 from ogs5py.tools.tools import (
     is_str_array,
     rotate_points,
@@ -91,12 +95,12 @@ class GLI(File):
         self.force_writing = True
 
         if gli_dict is None:
-            self.__dict = dcp(EMPTY_GLI)
+            self.__dict = new_gli_dict()
         elif check_gli_dict(gli_dict):
             self.__dict = gli_dict
         else:
             print("given gli_dict is not valid.. will set default")
-            self.__dict = dcp(EMPTY_GLI)
+            self.__dict = new_gli_dict()
 
     #        self.mainkw = [""]
 
@@ -266,7 +270,7 @@ class GLI(File):
     #######################
     def reset(self):
         """Delete every content."""
-        self.__dict = EMPTY_GLI
+        self.__dict = new_gli_dict()
 
     def load(self, filepath, verbose=False, encoding=None, **kwargs):
         r"""
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 """Tools for the ogs5py gli file."""
 from __future__ import division, print_function, absolute_import
-from copy import deepcopy as dcp
 import numpy as np
 from ogs5py.tools.types import (
     PLY_KEY_LIST,
@@ -18,6 +17,26 @@ from ogs5py.tools.types import (
 )
 from ogs5py.tools.tools import uncomment
 
+# precomputed key collections for the reader loops
+_GLI_KEYS = tuple(GLI_KEY_LIST)
+# first-token dispatch for the top-level keywords ("#POINTS" -> "POINTS")
+_GLI_BRANCH = {key: key[1:] for key in GLI_KEY_LIST}
+_PLY_STOP = frozenset(GLI_KEY_LIST + ["$" + key for key in PLY_KEY_LIST])
+_SRF_STOP = frozenset(GLI_KEY_LIST + ["$" + key for key in SRF_KEY_LIST])
+_VOL_STOP = frozenset(GLI_KEY_LIST + ["$" + key for key in VOL_KEY_LIST])
+# key -> type dispatch for the sub-keyword values
+_PLY_TYPE = dict(zip(PLY_KEY_LIST, PLY_TYPES))
+_SRF_TYPE = dict(zip(SRF_KEY_LIST, SRF_TYPES))
+_VOL_TYPE = dict(zip(VOL_KEY_LIST, VOL_TYPES))
+
+
+def new_gli_dict():
+    """Create a new empty gli dict with fresh sub-lists."""
+    return {
+        key: (list(val) if isinstance(val, list) else val)
+        for key, val in EMPTY_GLI.items()
+    }
+
 
 def load_ogs5gli(filepath, verbose=True, encoding=None):
     """
@@ -72,185 +91,189 @@ def load_ogs5gli(filepath, verbose=True, encoding=None):
     # in python3 open was replaced with io.open
     from io import open
 
-    out = dcp(EMPTY_GLI)
+    out = new_gli_dict()
 
+    # bind the info printer once, so the loop stays free of verbose-checks
+    log = print if verbose else (lambda *args, **kwargs: None)
+
+    # read the whole file at once and iterate with an index cursor
+    # this spares a syscall-roundtrip (readline/tell/seek) per line
     with open(filepath, "r", encoding=encoding) as gli:
-        # looping variable for reading
-        reading = True
-        # read the first line
-        line = gli.readline().strip()
-        found_first = False
-        while reading:
-            # if end of file without '#STOP' keyword reached, raise Error
-            filepos = gli.tell()
-            if not gli.readline() and not line.startswith("#STOP"):
-                raise EOFError("reached end of file... unexpected")
-            gli.seek(filepos)
-            # skip blank lines
-            if not line:
-                line = gli.readline().strip()
-                continue
-            # skip header
-            if not found_first and not line.startswith("#"):
-                line = gli.readline().strip()
-                continue
+        lines = gli.read().splitlines()
+
+    cur = 0
+    no_lines = len(lines)
+    reading = True
+    found_first = False
+    while reading:
+        # if end of file without '#STOP' keyword reached, raise Error
+        if cur >= no_lines:
+            raise EOFError("reached end of file... unexpected")
+        line = lines[cur].strip()
+        cur += 1
+        # skip blank lines
+        if not line:
+            continue
+        # skip header
+        if not found_first and not line.startswith("#"):
+            continue
+        # single dict lookup on the first token instead of scanning each key
+        head = line.split(None, 1)[0]
+        branch = _GLI_BRANCH.get(head)
+        if branch is None and line.startswith(_GLI_KEYS):
+            # keyword with content glued on (no whitespace after it)
+            for key in _GLI_KEYS:
+                if head.startswith(key):
+                    branch = _GLI_BRANCH[key]
+                    break
 
-            # check for points
-            elif line.startswith("#POINTS"):
-                found_first = True
-                if verbose:
-                    print("found 'POINTS'")
-                pnts = np.empty((0, 3), dtype=float)
-                ids = []  # workaround for bad ordering
-                names = []
-                mds = []
-                line = gli.readline().strip()
-                while line and line[0].isdigit():
-                    ln_splt = line.split()
-                    # need a list around map in python3 (map gives iterator)
-                    pnt = np.array(list(map(float, ln_splt[1:4])))
-                    ids.append(int(ln_splt[0]))
-                    pnts = np.vstack((pnts, pnt))
-                    if "$NAME" in ln_splt:
-                        names.append(ln_splt[ln_splt.index("$NAME") + 1])
-                    else:
-                        names.append("")
-                    if "$MD" in ln_splt:
-                        mds.append(float(ln_splt[ln_splt.index("$MD") + 1]))
-                    else:
-                        # use -inf as standard md, if none is given
-                        mds.append(-np.inf)
-                    line = gli.readline().strip()
-                # the list of point-ids (should be: 0 1 2 3 ...)
-                ids = np.array(ids, dtype=int)
-                if len(np.unique(ids)) != len(ids):
-                    raise ValueError(
-                        filepath
-                        + ": GLI: point ids are not unique: "
-                        + str(ids)
-                    )
-                if pnts.shape[0] > 0:
-                    # hack to shift the ids acordingly (if not ascending)
-                    id_shift = np.zeros(np.max(ids) + 1, dtype=int)
-                    id_shift[ids] = np.arange(ids.shape[0])
-                # save points
-                out["points"] = pnts
-                out["point_names"] = np.array(names, dtype=object)
-                out["point_md"] = np.array(mds, dtype=float)
-                continue
+        # check for points
+        if branch == "POINTS":
+            found_first = True
+            log("found 'POINTS'")
+            pnt_lines = []
+            while cur < no_lines:
+                line = lines[cur].strip()
+                if not line or not line[0].isdigit():
+                    break
+                pnt_lines.append(line.split())
+                cur += 1
+            # parse all coordinates at once (no per-point vstack)
+            pnts = np.array(
+                [ln_splt[1:4] for ln_splt in pnt_lines], dtype=float
+            ).reshape((len(pnt_lines), 3))
+            # preallocate with the defaults ("" and -inf for undefined md)
+            names = np.full(len(pnt_lines), "", dtype=object)
+            mds = np.full(len(pnt_lines), -np.inf, dtype=float)
+            for pnt_i, ln_splt in enumerate(pnt_lines):
+                # one pass over the optional "$KEY value" tail (id x y z ...)
+                if len(ln_splt) > 4:
+                    tags = dict(zip(ln_splt[4::2], ln_splt[5::2]))
+                    if "$NAME" in tags:
+                        names[pnt_i] = tags["$NAME"]
+                    if "$MD" in tags:
+                        mds[pnt_i] = float(tags["$MD"])
+            # the list of point-ids (should be: 0 1 2 3 ...)
+            ids = np.array(
+                [ln_splt[0] for ln_splt in pnt_lines], dtype=int
+            )
+            if len(np.unique(ids)) != len(ids):
+                raise ValueError(
+                    filepath + ": GLI: point ids are not unique: " + str(ids)
+                )
+            if pnts.shape[0] > 0:
+                # hack to shift the ids acordingly (if not ascending)
+                id_shift = np.zeros(np.max(ids) + 1, dtype=int)
+                id_shift[ids] = np.arange(ids.shape[0])
+            # save points
+            out["points"] = pnts
+            out["point_names"] = names
+            out["point_md"] = mds
+            continue
 
-            # check for polyline
-            elif line.startswith("#POLYLINE"):
-                found_first = True
-                if verbose:
-                    print("found 'POLYLINE'")
-                ply = dcp(EMPTY_PLY)
-                line = gli.readline().strip()
-                # assure, that we are reading one polyline
-                while not any([line.startswith(key) for key in GLI_KEY_LIST]):
-                    need_new_line = True
-                    key = uncomment(line)[0][1:] if uncomment(line) else ""
-                    if key in PLY_KEY_LIST:
-                        if key == "POINTS":
-                            ply["POINTS"] = []
-                            line = gli.readline().strip()
-                            while line and line.split()[0].isdigit():
-                                ply["POINTS"].append(int(line.split()[0]))
-                                line = gli.readline().strip()
-                            if line in (
-                                GLI_KEY_LIST + ["$" + k for k in PLY_KEY_LIST]
-                            ):
-                                need_new_line = False
-                            tmp_pnt = np.array(ply["POINTS"], dtype=int)
-                            # hack to shift point_ids (if not ascending)
-                            tmp_pnt = id_shift[tmp_pnt]
-                            ply["POINTS"] = tmp_pnt
-                        else:
-                            ply_typ = PLY_TYPES[PLY_KEY_LIST.index(key)]
-                            ply[key] = ply_typ(gli.readline().split()[0])
-                    if need_new_line:
-                        line = gli.readline().strip()
-                out["polylines"].append(ply)
-                continue
+        # check for polyline
+        elif branch == "POLYLINE":
+            found_first = True
+            log("found 'POLYLINE'")
+            ply = dict(EMPTY_PLY)
+            # assure, that we are reading one polyline
+            while cur < no_lines:
+                line = lines[cur].strip()
+                if line.startswith(_GLI_KEYS):
+                    break
+                cur += 1
+                sline = uncomment(line)
+                key = sline[0][1:] if sline else ""
+                if key in _PLY_TYPE:
+                    if key == "POINTS":
+                        ply["POINTS"] = []
+                        while cur < no_lines:
+                            line = lines[cur].strip()
+                            tok = line.split(None, 1)[0] if line else ""
+                            if not tok.isdigit():
+                                break
+                            ply["POINTS"].append(int(tok))
+                            cur += 1
+                        tmp_pnt = np.array(ply["POINTS"], dtype=int)
+                        # hack to shift point_ids (if not ascending)
+                        tmp_pnt = id_shift[tmp_pnt]
+                        ply["POINTS"] = tmp_pnt
+                    elif cur < no_lines:
+                        ply_typ = _PLY_TYPE[key]
+                        ply[key] = ply_typ(lines[cur].split()[0])
+                        cur += 1
+            out["polylines"].append(ply)
+            continue
 
-            # check for surface
-            elif line.startswith("#SURFACE"):
-                found_first = True
-                if verbose:
-                    print("found 'SURFACE'")
-                srf = dcp(EMPTY_SRF)
-                line = gli.readline().strip()
-                # assure, that we are reading one surface
-                while not any([line.startswith(key) for key in GLI_KEY_LIST]):
-                    need_new_line = True
-                    key = uncomment(line)[0][1:] if uncomment(line) else ""
-                    if key in SRF_KEY_LIST:
-                        if key == "POLYLINES":
-                            srf["POLYLINES"] = []
-                            line = gli.readline().strip()
-                            while line and line not in (
-                                GLI_KEY_LIST + ["$" + k for k in SRF_KEY_LIST]
-                            ):
-                                srf["POLYLINES"].append(str(line.split()[0]))
-                                line = gli.readline().strip()
-                            if line in (
-                                GLI_KEY_LIST + ["$" + k for k in SRF_KEY_LIST]
-                            ):
-                                need_new_line = False
-                        else:
-                            srf_typ = SRF_TYPES[SRF_KEY_LIST.index(key)]
-                            srf[key] = srf_typ(gli.readline().split()[0])
-                    if need_new_line:
-                        line = gli.readline().strip()
-                out["surfaces"].append(srf)
-                continue
+        # check for surface
+        elif branch == "SURFACE":
+            found_first = True
+            log("found 'SURFACE'")
+            srf = dict(EMPTY_SRF)
+            # assure, that we are reading one surface
+            while cur < no_lines:
+                line = lines[cur].strip()
+                if line.startswith(_GLI_KEYS):
+                    break
+                cur += 1
+                sline = uncomment(line)
+                key = sline[0][1:] if sline else ""
+                if key in _SRF_TYPE:
+                    if key == "POLYLINES":
+                        srf["POLYLINES"] = []
+                        while cur < no_lines:
+                            line = lines[cur].strip()
+                            if not line or line in _SRF_STOP:
+                                break
+                            srf["POLYLINES"].append(line.split(None, 1)[0])
+                            cur += 1
+                    elif cur < no_lines:
+                        srf_typ = _SRF_TYPE[key]
+                        srf[key] = srf_typ(lines[cur].split()[0])
+                        cur += 1
+            out["surfaces"].append(srf)
+            continue
 
-            # check for volume
-            elif line.startswith("#VOLUME"):
-                found_first = True
-                if verbose:
-                    print("found 'VOLUME'")
-                vol = dcp(EMPTY_VOL)
-                line = gli.readline().strip()
-                # assure, that we are reading one volume
-                while not any([line.startswith(key) for key in GLI_KEY_LIST]):
-                    need_new_line = True
-                    key = uncomment(line)[0][1:] if uncomment(line) else ""
-                    if key in VOL_KEY_LIST:
-                        if key == "SURFACES":
-                            vol["SURFACES"] = []
-                            line = gli.readline().strip()
-                            while line and line not in (
-                                GLI_KEY_LIST + ["$" + k for k in VOL_KEY_LIST]
-                            ):
-                                vol["SURFACES"].append(str(line.split()[0]))
-                                line = gli.readline().strip()
-                            if line in (
-                                GLI_KEY_LIST + ["$" + k for k in VOL_KEY_LIST]
-                            ):
-                                need_new_line = False
-                        else:
-                            vol_typ = VOL_TYPES[VOL_KEY_LIST.index(key)]
-                            vol[key] = vol_typ(gli.readline().split()[0])
-                    if need_new_line:
-                        line = gli.readline().strip()
-                out["volumes"].append(vol)
-                continue
+        # check for volume
+        elif branch == "VOLUME":
+            found_first = True
+            log("found 'VOLUME'")
+            vol = dict(EMPTY_VOL)
+            # assure, that we are reading one volume
+            while cur < no_lines:
+                line = lines[cur].strip()
+                if line.startswith(_GLI_KEYS):
+                    break
+                cur += 1
+                sline = uncomment(line)
+                key = sline[0][1:] if sline else ""
+                if key in _VOL_TYPE:
+                    if key == "SURFACES":
+                        vol["SURFACES"] = []
+                        while cur < no_lines:
+                            line = lines[cur].strip()
+                            if not line or line in _VOL_STOP:
+                                break
+                            vol["SURFACES"].append(line.split(None, 1)[0])
+                            cur += 1
+                    elif cur < no_lines:
+                        vol_typ = _VOL_TYPE[key]
+                        vol[key] = vol_typ(lines[cur].split()[0])
+                        cur += 1
+            out["volumes"].append(vol)
+            continue
 
-            # check for STOP
-            elif line.startswith("#STOP"):
-                if verbose:
-                    print("found '#STOP'")
-                # stop reading the file
-                reading = False
+        # check for STOP
+        elif branch == "STOP":
+            log("found '#STOP'")
+            # stop reading the file
+            reading = False
 
-            # handle unknown infos
-            else:
-                raise ValueError(
-                    filepath
-                    + ": GLI: file contains unknown infos: "
-                    + line.strip()
-                )
+        # handle unknown infos
+        else:
+            raise ValueError(
+                filepath + ": GLI: file contains unknown infos: " + line
+            )
 
     return out
 
@@ -318,84 +341,86 @@ def save_ogs5gli(
     else:
         con_ind = CON_IND
 
+    # bind the info printer once, so the loop stays free of verbose-checks
+    log = print if verbose else (lambda *args, **kwargs: None)
+
     with open(filepath, "w") as gli_f:
+        # accumulate all lines and write them with a single call
+        buf = []
         if top_com:
-            if verbose:
-                print("write top comment")
-            print(str(top_com), file=gli_f)
+            log("write top comment")
+            buf.append(str(top_com))
 
-        if verbose:
-            print("write #POINTS")
+        log("write #POINTS")
         if gli["points"] is not None:
-            print("#POINTS", file=gli_f)
-            # write all points
+            buf.append("#POINTS")
+            # hoist the dict lookups out of the point loop
+            pnt_names = gli["point_names"]
+            pnt_mds = gli["point_md"]
+            ninf = -np.inf
+            # generate all point lines
             for pnt_i, pnt in enumerate(gli["points"]):
                 # generate NAME
-                if gli["point_names"][pnt_i]:
-                    name = " $NAME " + str(gli["point_names"][pnt_i])
+                if pnt_names[pnt_i]:
+                    name = " $NAME " + str(pnt_names[pnt_i])
                 else:
                     name = ""
                 # generate MD
-                if gli["point_md"][pnt_i] == -np.inf:
+                if pnt_mds[pnt_i] == ninf:
                     pnt_md = ""
                 else:
-                    pnt_md = " $MD {}".format(gli["point_md"][pnt_i])
+                    pnt_md = " $MD %s" % pnt_mds[pnt_i]
                 # generate string for actual point
                 tupl = (pnt_i,) + tuple(pnt) + (name, pnt_md)
-                print("{} {} {} {}{}{}".format(*tupl), file=gli_f)
+                buf.append("%s %s %s %s%s%s" % tupl)
 
-        if verbose:
-            print("write #POLYLINES")
+        log("write #POLYLINES")
         # write all polylines
         if gli["polylines"] is not None:
             for ply in gli["polylines"]:
-                print("#POLYLINE", file=gli_f)
+                buf.append("#POLYLINE")
                 # generate polyline
                 for key in PLY_KEY_LIST:
                     if key != "POINTS" and ply[key] is not None:
-                        print(sub_ind + "$" + key, file=gli_f)
-                        print(con_ind + "{}".format(ply[key]), file=gli_f)
+                        buf.append(sub_ind + "$" + key)
+                        buf.append(con_ind + str(ply[key]))
                     elif ply[key] is not None:
-                        print(sub_ind + "$POINTS", file=gli_f)
+                        buf.append(sub_ind + "$POINTS")
                         for pnt in ply["POINTS"]:
-                            print(con_ind + "{}".format(pnt), file=gli_f)
+                            buf.append(con_ind + str(pnt))
 
-        if verbose:
-            print("write #SURFACES")
+        log("write #SURFACES")
         # write all surfaces
         if gli["surfaces"] is not None:
             for srf in gli["surfaces"]:
-                print("#SURFACE", file=gli_f)
+                buf.append("#SURFACE")
                 # generate surface
                 for key in SRF_KEY_LIST:
                     if key != "POLYLINES" and srf[key] is not None:
-                        print(sub_ind + "$" + key, file=gli_f)
-                        print(con_ind + "{}".format(srf[key]), file=gli_f)
+                        buf.append(sub_ind + "$" + key)
+                        buf.append(con_ind + str(srf[key]))
                     elif srf[key] is not None:
-                        print(sub_ind + "$POLYLINES", file=gli_f)
+                        buf.append(sub_ind + "$POLYLINES")
                         for ply in srf["POLYLINES"]:
-                            print(con_ind + "{}".format(ply), file=gli_f)
+                            buf.append(con_ind + str(ply))
 
-        if verbose:
-            print("write #VOLUMES")
+        log("write #VOLUMES")
         # write all volumes
         if gli["volumes"] is not None:
             for vol in gli["volumes"]:
-                print("#VOLUME", file=gli_f)
+                buf.append("#VOLUME")
                 # generate volume
                 for key in VOL_KEY_LIST:
                     if key != "SURFACES" and vol[key] is not None:
-                        print(sub_ind + "$" + key, file=gli_f)
-                        print(con_ind + "{}".format(vol[key]), file=gli_f)
+                        buf.append(sub_ind + "$" + key)
+                        buf.append(con_ind + str(vol[key]))
                     elif vol[key] is not None:
-                        print(sub_ind + "$SURFACES", file=gli_f)
+                        buf.append(sub_ind + "$SURFACES")
                         for srf in vol["SURFACES"]:
-                            print(con_ind + "{}".format(srf), file=gli_f)
+                            buf.append(con_ind + str(srf))
 
-        if verbose:
-            print("write #STOP")
+        log("write #STOP")
+        buf.append("#STOP")
         if bot_com:
-            print("#STOP", file=gli_f)
-            print(bot_com, end="", file=gli_f)
-        else:
-            print("#STOP", end="", file=gli_f)
+            buf.append(str(bot_com))
+        gli_f.write("\n".join(buf))
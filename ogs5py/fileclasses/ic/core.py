@@ -4,7 +4,6 @@
 from __future__ import absolute_import, division, print_function
 import os
 import numpy as np
-import pandas as pd
 from ogs5py.fileclasses.base import BlockFile, File
 from ogs5py.tools.types import STRTYPE
 
@@ -56,18 +55,18 @@ class IC(BlockFile):
     add_block
     """
 
-    MKEYS = ["INITIAL_CONDITION"]
+    MKEYS = ("INITIAL_CONDITION",)
     # sorted
-    SKEYS = [
-        [
+    SKEYS = (
+        (
             "PCS_TYPE",
             "PRIMARY_VARIABLE",
             "COMP_NAME",
             "STORE_VALUES",
             "DIS_TYPE",
             "GEO_TYPE",
-        ]
-    ]
+        ),
+    )
 
     STD = {
         "PCS_TYPE": "GROUNDWATER_FLOW",
@@ -299,13 +298,13 @@ class RFR(File):
                     print(line, file=fout)
                 print(self.var_count, file=fout)
                 print(self.var_info, file=fout)
-                data = pd.DataFrame(
-                    index=np.arange(self.data.shape[1]),
-                    columns=np.arange(len(self.variables) + 1),
+                # write index + data columns with one C-level formatter call
+                idx = np.arange(self.data.shape[1])
+                np.savetxt(
+                    fout,
+                    np.column_stack((idx, self.data.T)),
+                    fmt=["%i"] + len(self.variables) * ["%.17g"],
                 )
-                data.loc[:, 0] = np.arange(self.data.shape[1])
-                data.loc[:, 1:] = self.data.T
-                data.to_csv(fout, header=None, index=None, sep=" ", mode="a")
 
     def read_file(self, path, encoding=None, verbose=False):
         """Write the actual RFR input file to the given folder."""
@@ -326,12 +325,20 @@ class RFR(File):
                 unit = var_info.pop(0)
                 variables.append(var)
                 units.append(unit)
-        if verbose:
-            print("RFR.read_file: reading was fine.")
+            if verbose:
+                print("RFR.read_file: reading was fine.")
+            # the file handle is behind the headers, so loadtxt can
+            # continue right away with the data block
+            data = np.loadtxt(
+                fin,
+                dtype=float,
+                usecols=range(1, len(variables) + 1),
+                ndmin=2,
+            ).T
         self.headers = headers
         self.variables = variables
         self.units = units
-        self.data = np.loadtxt(path, dtype=float, skiprows=4)[:, 1:].T
+        self.data = data
         if verbose:
             print("RFR.read_file: data conversion was fine.")
 
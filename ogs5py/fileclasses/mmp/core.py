@@ -92,10 +92,10 @@ class MMP(BlockFile):
     add_block
     """
 
-    MKEYS = ["MEDIUM_PROPERTIES"]
+    MKEYS = ("MEDIUM_PROPERTIES",)
     # sorted
-    SKEYS = [
-        [
+    SKEYS = (
+        (
             "PCS_TYPE",
             "NAME",
             "GEO_TYPE",
@@ -141,8 +141,8 @@ class MMP(BlockFile):
             "ELEMENT_VOLUME_MULTIPLYER",
             "MEDIUM_TYPE",  # really?
             "DENSITY",  # really?
-        ]
-    ]
+        ),
+    )
 
     STD = {
         "GEOMETRY_DIMENSION": 2,
@@ -327,10 +327,12 @@ def get_mesh_center(mesh):
     else:
         tmp_mesh = mesh
 
-    node_stack = np.empty((0, 3))
-    for mesh_i in tmp_mesh:
-        if mesh_i["nodes"] is not None:
-            node_stack = np.vstack((node_stack, mesh_i["nodes"]))
+    node_list = [
+        mesh_i["nodes"] for mesh_i in tmp_mesh if mesh_i["nodes"] is not None
+    ]
+    if not node_list:
+        return None
+    node_stack = np.vstack(node_list)
 
     if node_stack.shape[0] == 0:
         return None
@@ -16,6 +16,9 @@ try:
 except ImportError:
     MAYA_AVAIL = False
 
+# upper bound for vtu hand-over files placed on a RAM-backed tmpfs
+_SHM_LIMIT = 128 * 2 ** 20
+
 
 def show_mesh(
     mesh,
@@ -79,20 +82,40 @@ def show_mesh(
 
     # new mayavi scenes
     mlab.figure()
-    with TemporaryDirectory() as tmpdirname:
-        vtkfile = os.path.join(tmpdirname, "data.vtu")
-        # export the mesh to the temp vtk file
-        export_mesh(
-            vtkfile,
-            mesh,
-            export_material_id=show_material_id,
-            export_element_id=show_element_id,
-            cell_data_by_id=show_cell_data,
-        )
-        # load the vtk file to mayavi's mlab
-        data_source = mlab.pipeline.open(vtkfile)
-        # create a surface out of the vtk source
-        surface = mlab.pipeline.surface(data_source)
+    # mayavi's reader and meshio's writer both need real file paths, so
+    # the hand-over file can not live in a memory buffer - but putting it
+    # on a RAM-backed tmpfs (if the system has one) avoids the disk trip.
+    # tmpfs space is capped (usually at half the RAM), so only moderate
+    # meshes go there and a full tmpfs falls back to the disk location
+    tmp_roots = [None]
+    shm_dir = "/dev/shm"
+    if os.path.isdir(shm_dir):
+        node_no = len(mesh["nodes"])
+        elem_no = sum(len(elem) for elem in mesh["elements"].values())
+        # ~100 bytes per node/element is a generous vtu size estimate
+        if 100 * (node_no + elem_no) < _SHM_LIMIT:
+            tmp_roots.insert(0, shm_dir)
+    for tmp_root in tmp_roots:
+        with TemporaryDirectory(dir=tmp_root) as tmpdirname:
+            vtkfile = os.path.join(tmpdirname, "data.vtu")
+            # export the mesh to the temp vtk file
+            try:
+                export_mesh(
+                    vtkfile,
+                    mesh,
+                    export_material_id=show_material_id,
+                    export_element_id=show_element_id,
+                    cell_data_by_id=show_cell_data,
+                )
+            except EnvironmentError:
+                if tmp_root is None:
+                    raise
+                continue  # tmpfs was full after all, retry on disk
+            # load the vtk file to mayavi's mlab
+            data_source = mlab.pipeline.open(vtkfile)
+            # create a surface out of the vtk source
+            surface = mlab.pipeline.surface(data_source)
+        break
     # make the edges visible
     surface.actor.property.edge_visibility = True
     surface.actor.property.line_width = 1.0
@@ -107,13 +130,13 @@ def show_mesh(
         if log_scale:
             surface.parent.scalar_lut_manager.lut.scale = "log10"
     elif show_material_id:
-        # set the bounds for the color range
-        min_id = np.inf
-        max_id = 0.0
-        for matid in mesh["material_id"]:
-            min_id = int(np.min((min_id, np.min(mesh["material_id"][matid]))))
-            max_id = int(np.max((max_id, np.max(mesh["material_id"][matid]))))
-        id_no = int(max_id - min_id + 1)
+        # set the bounds for the color range with one scan over all ids
+        all_ids = np.concatenate(
+            [np.ravel(ids) for ids in mesh["material_id"].values()]
+        )
+        min_id = int(all_ids.min())
+        max_id = int(all_ids.max())
+        id_no = max_id - min_id + 1
         surface.parent.parent._cell_scalars_name_changed("material_id")
         surface.parent.parent.update()
         surface.parent.scalar_lut_manager.use_default_range = False
@@ -2,7 +2,9 @@
 """Class for the ogs PARTICLE DEFINITION file for RANDOM_WALK."""
 
 from __future__ import absolute_import, division, print_function
+import os
 import numpy as np
+import pandas as pd
 from ogs5py.fileclasses.base import File
 
 
@@ -30,10 +32,28 @@ class PCT(File):
         super(PCT, self).__init__(task_root, task_id)
         self.s_flag = s_flag
         self.file_ext = ".pct"
-        if data:
-            self.data = np.array(data)
+        self.data = data
+
+    @property
+    def data(self):
+        """Particle data of the PCT file."""
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        if data is None:
+            data = np.zeros((0, 10))
         else:
-            self.data = np.zeros((0, 10))
+            # store one contiguous float64 block, so column slices
+            # (like the xyz positions) stay cheap views
+            try:
+                data = np.ascontiguousarray(data, dtype=float)
+            except (TypeError, ValueError):
+                # leave shape/content complaints to check()
+                data = np.ascontiguousarray(data)
+        self._data = data
+        # judge the shape once per assignment, so check() is a plain read
+        self._valid = data.ndim == 2 and data.shape[1] == 10
 
     @property
     def is_empty(self):
@@ -60,21 +80,20 @@ class PCT(File):
         result : bool
             Validity of the given gli.
         """
-        if self.data.ndim != 2:
-            if verbose:
+        if self._valid:
+            return True
+        if verbose:
+            if self.data.ndim != 2:
                 print("PCT: Data shape incorect. Need 2 dimensions.")
-            return False
-        elif self.data.shape[1] != 10:
-            if verbose:
+            else:
                 print("PCT: Data shape incorect. Need 10 columns.")
-            return False
-        return True
+        return False
 
     def reset(self):
         """Delete every content."""
         self.data = np.zeros((0, 10))
 
-    def save(self, path):
+    def save(self, path, **kwargs):
         """
         Save the actual PCT external file in the given path.
 
@@ -82,12 +101,23 @@ class PCT(File):
         ----------
         path : str
             path to where to file should be saved
+        fmt : str, optional
+            format of the data lines. "%.17g" keeps doubles exactly while
+            dropping trailing zeros, use e.g. "%.8g" for smaller files.
+            Default: "%.17g"
         """
+        fmt = kwargs.get("fmt", "%.17g")
         if not self.is_empty:
             with open(path, "w") as fout:
                 print(str(self.s_flag), file=fout)
                 print(str(self.data.shape[0]), file=fout)
-                np.savetxt(fout, self.data)
+                np.savetxt(fout, self.data, fmt=fmt)
+            # binary sidecar cache, so re-loading the data in python can
+            # skip the ascii parsing (the text file stays canonical for OGS5)
+            try:
+                np.save(path + ".npy", self.data)
+            except OSError:
+                pass
 
     def read_file(self, path, **kwargs):
         """
@@ -95,14 +125,38 @@ class PCT(File):
 
         Its path is given by "task_root+task_id+file_ext".
         """
+        # prefer an up-to-date binary sidecar over parsing the ascii data
+        npy_path = path + ".npy"
+        try:
+            use_npy = os.path.getmtime(npy_path) >= os.path.getmtime(path)
+        except OSError:
+            use_npy = False
+        # read the header and the data block in one pass
         with open(path, "r") as fin:
             self.s_flag = int(fin.readline().split(";")[0].split()[0])
-        # use numpy to read the data
-        self.data = np.loadtxt(path, skiprows=2)
+            if use_npy:
+                data = np.load(npy_path)
+            else:
+                fin.readline()  # skip the particle count (given by the data)
+                try:
+                    # round_trip parsing keeps the "%.17g" doubles bit-exact
+                    data = pd.read_csv(
+                        fin,
+                        header=None,
+                        sep=r"\s+",
+                        float_precision="round_trip",
+                    ).values
+                except pd.errors.EmptyDataError:
+                    data = np.zeros((0, 10))
+        self.data = data
 
     def __repr__(self):
         """Representation."""
         out = str(self.s_flag) + "\n"
         out += str(self.data.shape[0]) + "\n"
-        out += str(self.data)
+        # only render the first rows, so huge particle sets print instantly
+        for data_e in np.atleast_2d(self.data)[:10]:
+            out += " ".join(map(str, data_e)) + "\n"
+        if self.data.shape[0] > 10:
+            out += "..."
         return out
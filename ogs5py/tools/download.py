@@ -19,15 +19,15 @@ A downloading routine to get the OSG5 executable.
 """
 from __future__ import division, print_function, absolute_import
 
+import io
 import os
 import shutil
 import tarfile
 import zipfile
 
 try:  # PY3
-    from urllib.request import urlretrieve, urlopen
+    from urllib.request import urlopen
 except ImportError:  # PY2
-    from urllib import urlretrieve
     from urllib2 import urlopen
 
 import tempfile
@@ -38,8 +38,11 @@ import lxml.html
 # TemporaryDirectory not avialable in python2
 # from: https://gist.github.com/cpelley/10e2eeaf60dacc7956bb
 class _TemporaryDirectory(object):
+    def __init__(self, suffix="", prefix="tmp", dir=None):
+        self.kwargs = {"suffix": suffix, "prefix": prefix, "dir": dir}
+
     def __enter__(self):
-        self.dir_name = tempfile.mkdtemp()
+        self.dir_name = tempfile.mkdtemp(**self.kwargs)
         return self.dir_name
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -162,8 +165,12 @@ def download_ogs(
     }
     system = platform.system() if system is None else system
     path = os.path.abspath(path)
-    if not os.path.exists(path):
+    # race-free directory creation (no exist_ok in python 2)
+    try:
         os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
     if version not in URLS:
         raise ValueError(
             "'{}': unknown version. Use: {}".format(version, list(URLS))
@@ -202,25 +209,33 @@ def download_ogs(
     if name is None:
         name = "ogs.exe" if system == "Windows" else "ogs"
     dest = os.path.join(path, name)
-    with TemporaryDirectory() as tmpdirname:
-        data_filename = os.path.join(tmpdirname, "data" + ext)
-        urlretrieve(ogs_url, data_filename)
-        # extract the data
+    # stream the archive into memory, skipping the temporary-file round-trip
+    archive = io.BytesIO(urlopen(ogs_url).read())
+    if ext == ".tar.gz":
+        z_file = tarfile.open(fileobj=archive, mode="r:gz")
+        names = z_file.getnames()
+    else:
+        z_file = zipfile.ZipFile(archive)
+        names = z_file.namelist()
+    found = ""
+    for file in names:
+        if os.path.basename(file).startswith("ogs"):
+            found = file
+            break
+    if found:
+        # write the single wanted member directly to its destination
         if ext == ".tar.gz":
-            z_file = tarfile.open(data_filename, "r:gz")
-            names = z_file.getnames()
+            member = z_file.extractfile(found)
+            mode = z_file.getmember(found).mode
         else:
-            z_file = zipfile.ZipFile(data_filename)
-            names = z_file.namelist()
-        found = ""
-        for file in names:
-            if os.path.basename(file).startswith("ogs"):
-                found = file
-                break
-        if found:
-            z_file.extract(member=found, path=tmpdirname)
-            shutil.copy(os.path.join(tmpdirname, found), dest)
-        z_file.close()
+            member = z_file.open(found)
+            mode = None
+        with open(dest, "wb") as ogs_exe:
+            shutil.copyfileobj(member, ogs_exe)
+        member.close()
+        if mode is not None:  # keep the executable bit from the tar-ball
+            os.chmod(dest, mode)
+    z_file.close()
     return dest if found else None
 
 
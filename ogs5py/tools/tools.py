@@ -60,11 +60,17 @@ import glob
 import collections
 import ast
 import itertools
-from copy import deepcopy as dcp
 import numpy as np
 
 from ogs5py.tools.types import STRTYPE, OGS_EXT
 
+# scipy's quaternion based rotation is faster for big point clouds,
+# but scipy is no hard dependency of ogs5py
+try:
+    from scipy.spatial.transform import Rotation
+except ImportError:
+    Rotation = None
+
 
 class Output(object):
     """A class to duplicate an output stream to stdout.
@@ -268,6 +274,27 @@ def guess_type(string):
         given string containing the value
     """
     string = str(string)
+    # fast path for plain numbers (the bulk of ogs file content)
+    # detect integers without raising, so float tokens (like the values in
+    # id-value pairs) don't pay for a failed int-conversion each
+    digits = string.lstrip("+-").replace("_", "")
+    if digits.isdigit():
+        # "007" is no py3 literal: tokens with leading zeros (often names)
+        # also skip the float parser and stay strings via literal_eval
+        if digits == "0" or not digits.startswith("0"):
+            try:
+                return int(string)
+            except ValueError:  # e.g. repeated signs
+                pass
+    else:
+        try:
+            value = float(string)
+        except ValueError:
+            pass
+        else:
+            # "inf"/"nan" are no literals, leave them to the parser below
+            if np.isfinite(value):
+                return value
     try:
         value = ast.literal_eval(string)
     except Exception:  # SyntaxError or ValueError
@@ -285,6 +312,14 @@ def format_content_line(content):
     content : anything
         Single object, or list of objects
     """
+    # fast path: the file reader hands in lines already split to strings
+    if isinstance(content, list) and all(
+        isinstance(con, STRTYPE) for con in content
+    ):
+        content = list(
+            itertools.chain.from_iterable(con.split() for con in content)
+        )
+        return list(map(guess_type, content))
     # assure that content is a list of strings
     content = list(np.array(content, dtype=str).reshape(-1))
     # if the content is given as string with whitespaces, split it
@@ -548,11 +583,14 @@ def rotate_points(
     new_array : ndarray
         rotated array
     """
+    rotation_point = np.asarray(rotation_point)
+    if Rotation is not None:
+        axis = np.asarray(rotation_axis, dtype=float)
+        rot = Rotation.from_rotvec(angle * axis / np.linalg.norm(axis))
+        return rot.apply(points - rotation_point) + rotation_point
     rot = rotation_matrix(rotation_axis, angle)
-    new_points = shift_points(points, -1.0 * np.array(rotation_point))
-    new_points = np.inner(rot, new_points).T
-    new_points = shift_points(new_points, rotation_point)
-    return new_points
+    # rotate around the rotation point with a single matrix product
+    return (points - rotation_point).dot(rot.T) + rotation_point
 
 
 def shift_points(points, vector):
@@ -571,10 +609,8 @@ def shift_points(points, vector):
     new_array : ndarray
         shifted array
     """
-    new_points = dcp(points)
-    for i in range(3):
-        new_points[:, i] += vector[i]
-    return new_points
+    # one broadcasted addition (allocates the output) over a per-axis loop
+    return np.asarray(points) + np.asarray(vector)
 
 
 def transform_points(points, xyz_func, **kwargs):
@@ -661,30 +697,22 @@ def hull_deform(
     if func_bot is None:
         func_bot = niv_bot
 
+    # evaluate the hulls once, constants broadcast as plain scalars
     if isinstance(func_top, (float, int)):
-
-        def func_top_redef(x_in, __):
-            """Redefining func_top for constant value."""
-            return float(func_top) * np.ones_like(x_in)
-
-        func_t = func_top_redef
+        top = float(func_top)
     else:
-        func_t = func_top
+        top = func_top(x1_in, x2_in)
 
     if isinstance(func_bot, (float, int)):
-
-        def func_bot_redef(x_in, __):
-            """Redefining func_bot for constant value."""
-            return float(func_bot) * np.ones_like(x_in)
-
-        func_b = func_bot_redef
+        bot = float(func_bot)
     else:
-        func_b = func_bot
+        bot = func_bot(x1_in, x2_in)
 
-    scale = (x3_in - niv_bot) / (niv_top - niv_bot)
-    x3_out = scale * (func_t(x1_in, x2_in) - func_b(x1_in, x2_in)) + func_b(
-        x1_in, x2_in
-    )
+    # fuse the deformation arithmetic in-place on a single output buffer
+    x3_out = x3_in - float(niv_bot)
+    x3_out /= niv_top - niv_bot
+    x3_out *= top - bot
+    x3_out += bot
 
     if direction == "x":
         return x3_out, x1_in, x2_in
@@ -718,9 +746,13 @@ def rotation_matrix(vector, angle):
         matrix to be used for matrix multiplication with vectors to be
         rotated.
     """
-    # vector has to be normed
-    vector = np.asfarray(vector) / np.linalg.norm(vector)
-    mat = np.cross(np.eye(3), vector)
+    # vector has to be normed (asfarray was removed in numpy 2)
+    vector = np.asarray(vector, dtype=float) / np.linalg.norm(vector)
+    v_x, v_y, v_z = vector
+    # cross-product matrix of the axis, written out directly
+    mat = np.array(
+        [[0.0, -v_z, v_y], [v_z, 0.0, -v_x], [-v_y, v_x, 0.0]]
+    )
     cosa = np.cos(angle)
     sina = np.sin(angle)
     return (
@@ -752,12 +784,30 @@ def replace(arr, inval, outval):
     inval = np.array(inval).reshape(-1)
     outval = np.array(outval).reshape(-1)
     arrtmp = np.copy(arr).reshape(-1)
+    # fast path for integer values spanning a dense range (like mesh ids):
+    # scatter into a lookup table once and replace by direct indexing
+    if (
+        inval.size > 0
+        and np.issubdtype(arrtmp.dtype, np.integer)
+        and np.issubdtype(inval.dtype, np.integer)
+    ):
+        in_min = inval.min()
+        span = inval.max() - in_min + 1
+        if span <= 2 * max(inval.size, arrtmp.size):
+            # identity table, so in-between values stay untouched
+            lut = np.arange(in_min, in_min + span, dtype=arrtmp.dtype)
+            lut[inval - in_min] = outval
+            mask = np.logical_and(
+                arrtmp >= in_min, arrtmp < in_min + span
+            )
+            arrtmp[mask] = lut[arrtmp[mask] - in_min]
+            return arrtmp.reshape(arr.shape)
     # sort inval and outval according to inval (needed for searchsorted)
     sort = np.argsort(inval)
     inval = inval[sort]
     outval = outval[sort]
     # replace values
-    mask = np.in1d(arrtmp, inval)
+    mask = np.isin(arrtmp, inval)
     arrtmp[mask] = outval[np.searchsorted(inval, arrtmp[mask])]
 
     return arrtmp.reshape(arr.shape)
@@ -809,20 +859,25 @@ def unique_rows(data, decimals=4, fast=True):
     if fast:
         # round the input to the given precicion
         tmp = np.around(data, decimals=decimals)
-        # using the 1D numpy 'unique' function by defining a special dtype
-        # since numpy 1.13.0 actually not needed anymore (axis parameter added)
-        tmp = np.ascontiguousarray(tmp).view(
-            np.dtype((np.void, tmp.dtype.itemsize * tmp.shape[1]))
+        # unique directly over rows (axis parameter added in numpy 1.13.0)
+        __, i_x, i_xr = np.unique(
+            tmp, axis=0, return_index=True, return_inverse=True
         )
+        # numpy versions differ in the inverse shape for the axis case
+        i_xr = i_xr.reshape(-1)
     else:
         # get the tolerance from the given decimals
         tol = np.power(10.0, -decimals)
         # calculate all distances to each other (fancy!)
-        dim_i = []
+        # accumulate the squared distances in-place, so only one
+        # n x n buffer is alive besides the current difference matrix
+        distance = np.zeros((data.shape[0], data.shape[0]))
         for i in range(data.shape[1]):
             # is this a bottle neck? ... apparently
-            dim_i.append(np.subtract.outer(data[:, i], data[:, i]) ** 2)
-        distance = np.sqrt(np.sum(dim_i, axis=0))
+            diff = np.subtract.outer(data[:, i], data[:, i])
+            diff **= 2
+            distance += diff
+        np.sqrt(distance, out=distance)
         # just use the upper triangle above the diagonal
         distance[np.tril_indices_from(distance)] = np.inf
         # look which points are close
@@ -834,8 +889,10 @@ def unique_rows(data, decimals=4, fast=True):
         pos, ind = np.unique(close[1], return_index=True)
         val = close[0][ind]
         tmp[pos] = val
-    # now sort the indices and make them unique
-    __, i_x, i_xr = np.unique(tmp, return_index=True, return_inverse=True)
+        # now sort the indices and make them unique
+        __, i_x, i_xr = np.unique(
+            tmp, return_index=True, return_inverse=True
+        )
     out = data[i_x]
     # sort the output according to the input
     sort = np.argsort(i_x)